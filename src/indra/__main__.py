@@ -1,3 +1,3 @@
-from indra.cli import app
+from indra.cli import main
 
-app(obj={}, prog_name="indra")
+main(prog_name="indra")
@@ -1,90 +1,111 @@
+import argparse
+import importlib
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
 
-import typer
-from dotenv import load_dotenv
-
-from indra.fetch import cds_app, imd_app
-from indra.logging_config import configure_logging
-
-# Create the main app
-app = typer.Typer(
-    name="indra",
-    help="CLI tool for fetching and processing weather data",
-)
-
-def load_environment():
-    """Load environment variables from .env file"""
-    # Try to find .env file in current directory or parent directories
-    env_path = Path('.env')
-    if not env_path.exists():
-        raise typer.Exit(
-            "No .env file found in current directory.\n"
-            "Please create one by copying example.env:\n"
-            "cp example.env .env"
-        )
-    # Load the .env file
-    if not load_dotenv(env_path):
-        raise typer.Exit(f"Failed to load environment variables from {env_path}")
-
-@app.callback()
-def callback():
-    """Initialize the CLI application"""
-    load_environment()
-# Create a fetch subcommand group
-fetch_app = typer.Typer(
-    name="fetch",
-    help="Fetch data from various sources",
-)
 
 def get_default_log_filename() -> str:
     """Generate default log filename based on timestamp."""
     return f"indra_{datetime.now().strftime('%Y%m%d')}.log"
 
-@app.callback()
-def main(
-    ctx: typer.Context,
-    log_level: str = typer.Option(
-        "INFO",
+def existing_file(value: str) -> Path:
+    """Argparse type for a path that must point to an existing file, resolved to an absolute path."""
+    path = Path(value).resolve()
+    if not path.is_file():
+        raise argparse.ArgumentTypeError(f"File '{value}' does not exist or is a directory.")
+    return path
+
+def add_debug_flags(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--debug",
+        "-d",
+        dest="debug",
+        action="store_true",
+        help="Enable debug mode, send email without actually downloading data"
+    )
+    parser.add_argument("--no-debug", "-D", dest="debug", action="store_false", help="Disable debug mode")
+    parser.set_defaults(debug=False)
+
+def build_parser(prog: str | None = None) -> argparse.ArgumentParser:
+    """Build the argument parser for the full ``indra`` command tree."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="CLI tool for fetching and processing weather data",
+    )
+    parser.add_argument(
         "--log-level",
         "-l",
+        default="INFO",
         help="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
-    ),
-    log_file: Optional[str] = typer.Option(
-        None,
+    )
+    parser.add_argument(
         "--log-file",
         "-f",
+        default=None,
         help="Custom log filename. If not provided, uses timestamp-based default"
-    ),
-) -> None:
-    """Initialize logging for the entire CLI application."""
-    # Ensure we have a context object
-    ctx.obj = ctx.obj or {}
+    )
+    subparsers = parser.add_subparsers(dest="cmd", required=True)
+
+    # Create a fetch subcommand group
+    fetch_parser = subparsers.add_parser("fetch", help="Fetch data from various sources")
+    fetch_subparsers = fetch_parser.add_subparsers(dest="source", required=True)
+
+    cds_parser = fetch_subparsers.add_parser(
+        "cds",
+        help="Process and upload CDS ERA5 daily data to S3",
+        description=(
+            "Fetches ERA5 reanalysis data from the Climate Data Store (CDS) and uploads it to S3. "
+            "Uses the configuration from the provided YAML file for data parameters, S3 settings, and notification recipients."
+        ),
+    )
+    cds_parser.add_argument("yaml_path", type=existing_file, help="Path to YAML configuration file containing CDS parameters")
+    cds_parser.add_argument(
+        "--current-month",
+        "-c",
+        dest="current_month",
+        action="store_true",
+        help="Use current month for date range"
+    )
+    cds_parser.add_argument("--custom-date", "-C", dest="current_month", action="store_false", help="Use dates from config")
+    cds_parser.set_defaults(current_month=True)
+    add_debug_flags(cds_parser)
+    cds_parser.set_defaults(
+        handler="indra.fetch.cds:main",
+        handler_args=("yaml_path", "current_month", "debug", "log_level", "log_file"),
+    )
+
+    imd_parser = fetch_subparsers.add_parser("imd", help="Fetch live IMD data and upload it to S3")
+    imd_parser.add_argument("yaml_path", type=existing_file, help="Path to YAML configuration file containing IMD parameters")
+    add_debug_flags(imd_parser)
+    imd_parser.add_argument("--timecode", "-t", default=None, help="Timecode to retrieve data for")
+    imd_parser.set_defaults(handler="indra.fetch.imd:main", handler_args=("yaml_path", "debug", "timecode"))
+
+    return parser
+
+def main(argv: list[str] | None = None, prog_name: str | None = None) -> None:
+    """Parse the command line, initialize logging for the entire CLI application and dispatch the subcommand."""
+    args = build_parser(prog=prog_name).parse_args(argv)
+
+    from indra.logging_config import configure_logging
 
     # Generate default log filename if none provided
-    if log_file is None:
-        log_file = get_default_log_filename()
+    if args.log_file is None:
+        args.log_file = get_default_log_filename()
 
     # Configure logging
     configure_logging(
-        level=log_level,
-        log_file=log_file,
+        level=args.log_level,
+        log_file=args.log_file,
         console=True,
         logger_name="indra"
     )
 
-    # Store the logging configuration in the context
-    ctx.obj.update({
-        "log_level": log_level,
-        "log_file": log_file
-    })
-
-# Add fetch as a subcommand to main app
-app.add_typer(fetch_app, name="fetch")
+    # Each subcommand registers its handler as "module:function" (imported only here, so --help and argument
+    # errors stay cheap) and the names of the parsed arguments it takes as keyword arguments
+    module_name, attr = args.handler.split(":")
+    handler = getattr(importlib.import_module(module_name), attr)
+    handler(**{name: getattr(args, name) for name in args.handler_args})
 
-# Add cds as a subcommand to fetch
-fetch_app.add_typer(cds_app, name="cds")
-fetch_app.add_typer(imd_app, name="imd")
 if __name__ == "__main__":
-    app(obj={})
+    main(sys.argv[1:])
@@ -1,24 +1,72 @@
+import atexit
+import base64
 import logging
+import mmap
 import os
 import smtplib
 import ssl
 from datetime import datetime
-from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from enum import Enum
+from typing import ClassVar
 
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+# Authenticated SMTP sessions keyed by (server, port, sender), reused across Report.send_email calls.
+# Reports are sent from a single thread; concurrent senders would each need their own cache (e.g. threading.local).
+_SMTP_CACHE: dict[tuple[str, str, str], smtplib.SMTP] = {}
+
+def _get_smtp_connection(smtp_server, port, email, password) -> smtplib.SMTP:
+    """Return a live, logged-in SMTP connection, reusing a cached one when it still responds."""
+    key = (smtp_server, port, email)
+    server = _SMTP_CACHE.get(key)
+    if server is not None:
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        logger.debug("Cached SMTP connection is no longer alive. Reconnecting")
+        _close_smtp_connection(_SMTP_CACHE.pop(key))
+
+    logger.info("Connecting to email server")
+    server = smtplib.SMTP(smtp_server, port)
+    try:
+        server.starttls(context=ssl.create_default_context())
+        server.login(email, password)
+    except Exception:
+        _close_smtp_connection(server)
+        raise
+    _SMTP_CACHE[key] = server
+    return server
+
+def _evict_smtp_connection(smtp_server, port, email):
+    server = _SMTP_CACHE.pop((smtp_server, port, email), None)
+    if server is not None:
+        _close_smtp_connection(server)
+
+def _close_smtp_connection(server: smtplib.SMTP):
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+@atexit.register
+def _close_cached_smtp_connections():
+    while _SMTP_CACHE:
+        _close_smtp_connection(_SMTP_CACHE.popitem()[1])
+
 class Status(Enum):
     SUCCESS = 1
     CRITICAL = 2
     ERROR = 3
 
 class ReportEntry:
+    __slots__ = ('comments', 'component_name', 'status')
 
     def __init__(self, component_name, status, comments):
         self.component_name = component_name
@@ -29,7 +77,31 @@ class ReportEntry:
         return [self.component_name, self.status, self.comments]
 
 class Report:
-    reports: list[ReportEntry]
+    __slots__ = (
+        'EMAIL',
+        'PASSWORD',
+        'PORT',
+        'SMTP_SERVER',
+        '_pending_attachments',
+        'email_recipients',
+        'job_name',
+        'reports',
+        'run_date',
+    )
+
+    _COLOR: ClassVar[dict[Status, str]] = {
+        Status.SUCCESS: 'green',
+        Status.CRITICAL: 'red',
+        Status.ERROR: 'orange',
+    }
+    _TD = "border: 1px solid black; padding: 10px"
+    _ROW_TMPL = (
+        "<tr style='border: 1px solid black; font-size: 18px; color: {color}'>"
+        "<td style='{td}'>{component_name}</td>"
+        "<td style='{td}'>{status}</td>"
+        "<td style='{td}'>{comments}</td>"
+        "</tr>"
+    )
 
     def __init__(self, job_name, email_recipients, run_date=None):
 
@@ -41,7 +113,7 @@ class Report:
         self.email_recipients = email_recipients
 
 
-        self.reports = []
+        self.reports: list[ReportEntry] = []
 
         load_dotenv()
 
@@ -50,87 +122,100 @@ class Report:
         self.EMAIL = os.getenv('EMAIL')
         self.PASSWORD = os.getenv('PASSWORD')
 
-        self.message = MIMEMultipart()
+        # Encoded attachment parts, added to a freshly built message on every send
+        self._pending_attachments: list[MIMEBase] = []
 
     def add_a_status_report(self, component_name: str, status: Status, comments: str):
         self.reports.append(ReportEntry(component_name, status, comments))
 
-    def collate_report_entries(self):
+    def collate_report_entries(self) -> tuple[str, str]:
+        """Return the email subject, prefixed when any entry is critical or an error, and the HTML body."""
 
         subject = self.job_name + ' || ' + self.run_date
 
-        html = """
-                <html><body><table style="border: 1px solid black;"><tr style="border: 1px solid black;">
-                """
-
-        for header in ["Component Name", "Status", "Comments"]:
-            string = f"<th style='border: 1px solid black; font-size: 20px; padding: 10px'>{header}</th>"
-            html += string
-
-        html += "</tr>"
-
-        # data = [report._to_list() for report in self.reports]
+        parts = ['<html><body><table style="border: 1px solid black;"><tr style="border: 1px solid black;">']
+        parts.extend(
+            f"<th style='border: 1px solid black; font-size: 20px; padding: 10px'>{header}</th>"
+            for header in ["Component Name", "Status", "Comments"]
+        )
+        parts.append("</tr>")
 
+        # Single pass over the entries: render each row and note whether any are critical or errors
+        has_criticals = has_errors = False
         for report_entry in self.reports:
-            if report_entry.status == Status.SUCCESS:
-                color = 'green'
-            elif report_entry.status == Status.CRITICAL:
-                color = 'red'
-            elif report_entry.status == Status.ERROR:
-                color = 'orange'
-
-            html += f"<tr style='border: 1px solid black; font-size: 18px; color: {color}'>"
-            html += f"<td style='border: 1px solid black; padding: 10px'>{report_entry.component_name}</td>"
-            html += f"<td style='border: 1px solid black; padding: 10px'>{report_entry.status}</td>"
-            html += f"<td style='border: 1px solid black; padding: 10px'>{report_entry.comments}</td>"
-            html += "</tr>"
-
-        html += "</table></body></html>"
-
-        if any([report_entry.status == Status.CRITICAL for report_entry in self.reports]):
+            has_criticals |= report_entry.status == Status.CRITICAL
+            has_errors |= report_entry.status == Status.ERROR
+            parts.append(self._ROW_TMPL.format(
+                color=self._COLOR.get(report_entry.status, 'black'),
+                td=self._TD,
+                component_name=report_entry.component_name,
+                status=report_entry.status,
+                comments=report_entry.comments,
+            ))
+
+        parts.append("</table></body></html>")
+        html = "".join(parts)
+
+        if has_criticals:
             subject = 'CRITICAL ERROR!! - ' + subject
 
-        if any([report_entry.status == Status.ERROR for report_entry in self.reports]):
+        if has_errors:
             subject = 'Errors raised - ' + subject
 
-
-        self.message["From"] = 'Artpark Automated Pipelines'
-        self.message["To"] = self.email_recipients
-        self.message["Subject"] = subject
-        self.message.attach(MIMEText(html,'html'))
-
-        return self.message.as_string()
+        return subject, html
 
     def add_attachment(self, filepath):
         try:
+            part = MIMEBase("application", "octet-stream")
             with open(filepath, "rb") as attachment:
-                part = MIMEBase("application", "octet-stream")
-                part.set_payload(attachment.read())
-
-            encoders.encode_base64(part)
-
-            attachment_name = filepath.split('/')[-1]
+                # mmap cannot map an empty file
+                if os.fstat(attachment.fileno()).st_size:
+                    # Encode straight from the mapped file instead of reading it into memory first
+                    with mmap.mmap(attachment.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        part.set_payload(base64.encodebytes(mapped).decode("ascii"))
+                else:
+                    part.set_payload("")
+            part["Content-Transfer-Encoding"] = "base64"
+
+            attachment_name = os.path.basename(filepath)
             part.add_header(
                 "Content-Disposition",
                 f"attachment; filename= {attachment_name}",
             )
 
-            self.message.attach(part)
+            self._pending_attachments.append(part)
             print("added attachment")
         except Exception as e:
             logger.error(f"Failed to attach file {filepath}: {e}")
             raise
 
+    def build_message(self) -> MIMEMultipart:
+        """Build a fresh MIME message, so repeated sends never accumulate duplicate headers or parts."""
+        subject, html = self.collate_report_entries()
+
+        message = MIMEMultipart()
+        message["From"] = 'Artpark Automated Pipelines'
+        message["To"] = self.email_recipients
+        message["Subject"] = subject
+        message.attach(MIMEText(html, 'html'))
+        for part in self._pending_attachments:
+            message.attach(part)
+        return message
+
     def send_email(self):
 
-        text = self.collate_report_entries()
+        text = self.build_message().as_string()
 
-        with smtplib.SMTP(self.SMTP_SERVER, self.PORT) as server:
-            logger.info("Connecting to email server")
-            server.starttls(context=ssl.create_default_context())
-            server.login(self.EMAIL, self.PASSWORD)
+        server = _get_smtp_connection(self.SMTP_SERVER, self.PORT, self.EMAIL, self.PASSWORD)
+        try:
+            server.sendmail(self.EMAIL, self.email_recipients, text)
+        except smtplib.SMTPServerDisconnected:
+            # The server can drop a cached connection between the liveness probe and the send
+            logger.warning("Email server closed the connection. Reconnecting and retrying once")
+            _evict_smtp_connection(self.SMTP_SERVER, self.PORT, self.EMAIL)
+            server = _get_smtp_connection(self.SMTP_SERVER, self.PORT, self.EMAIL, self.PASSWORD)
             server.sendmail(self.EMAIL, self.email_recipients, text)
-            logger.info("Email sent successfully")
+        logger.info("Email sent successfully")
 
     def any_criticals(self):
-        return any([report.status == Status.CRITICAL for report in self.reports])
+        return any(report.status == Status.CRITICAL for report in self.reports)
@@ -1,14 +1,33 @@
-from indra.fetch.cds import app as cds_app
-from indra.fetch.cds import check_cds_credentials, fetch_and_upload_cds_data, last_date_of_cds_data, retrieve_data_from_cds
-from indra.fetch.imd import app as imd_app
-from indra.fetch.imd import clean_imd_data, retrieve_live_data_from_imd
+import importlib
+
+# Submodules pull in pandas, cdsapi and friends, so they are only imported when one of their names is first accessed.
+_LAZY_ATTRS = {
+    "check_cds_credentials": ("indra.fetch.cds", "check_cds_credentials"),
+    "clean_imd_data": ("indra.fetch.imd", "clean_imd_data"),
+    "fetch_and_upload_cds_data": ("indra.fetch.cds", "fetch_and_upload_cds_data"),
+    "last_date_of_cds_data": ("indra.fetch.cds", "last_date_of_cds_data"),
+    "retrieve_data_from_cds": ("indra.fetch.cds", "retrieve_data_from_cds"),
+    "retrieve_live_data_from_imd": ("indra.fetch.imd", "retrieve_live_data_from_imd"),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_ATTRS[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_ATTRS])
+
 
 __all__ = [
-    "cds_app",
     "check_cds_credentials",
     "clean_imd_data",
     "fetch_and_upload_cds_data",
-    "imd_app",
     "last_date_of_cds_data",
     "retrieve_data_from_cds",
     "retrieve_live_data_from_imd"
@@ -6,10 +6,9 @@ from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Annotated, Optional, Union
+from typing import Optional, Union
 
 import cdsapi
-import typer
 from requests.exceptions import HTTPError
 
 from indra.emails import Report, Status
@@ -18,8 +17,6 @@ from indra.io import get_params, upload_data_to_s3
 logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
 
-app = typer.Typer()
-
 def last_date_of_cds_data(suppress_output=True):
     """
     Returns the last date for which ERA5 data is available on the CDS.
@@ -364,42 +361,17 @@ def fetch_and_upload_cds_data(
     else:
         return False, total_no_files, latest_timestamp
 
-@app.callback(invoke_without_command=True)
 def main(
-    ctx: typer.Context,
-    yaml_path: Annotated[
-        Path,
-        typer.Argument(
-            exists=True,
-            dir_okay=False,
-            resolve_path=True,
-            help="Path to YAML configuration file containing CDS parameters"
-        )
-    ],
-    current_month: Annotated[
-        bool,
-        typer.Option(
-            "--current-month/--custom-date",
-            "-c/-C",
-            help="Use current month for date range, or use dates from config"
-        )
-    ] = True,
-    debug: Annotated[
-        bool,
-        typer.Option(
-            "--debug/--no-debug",
-            "-d/-D",
-            help="Enable debug mode, send email without actually downloading data"
-        )
-    ] = False
+    yaml_path: Path,
+    current_month: bool = True,
+    debug: bool = False,
+    log_level: str = "INFO",
+    log_file: Optional[str] = None,
 ) -> None:
     """Process and upload CDS ERA5 daily data to S3.
     Fetches ERA5 reanalysis data from the Climate Data Store (CDS) and uploads it to S3.
     Uses the configuration from the provided YAML file for data parameters, S3 settings, and notification recipients.
     """
-    # Get the parent app's logging configuration
-    parent_config = ctx.obj or {}
-
     params = get_params(yaml_path=yaml_path)
     email_recipients = params['shared_params']['email_recipients']
     cds_params = params['cds']
@@ -415,8 +387,8 @@ def main(
             upload_success, no_files, latest_timestamp = fetch_and_upload_cds_data(
                 yaml_path=yaml_path,
                 current_month=current_month,
-                log_level=parent_config.get("log_level", "INFO"),
-                log_filename=parent_config.get("log_file")
+                log_level=log_level,
+                log_filename=log_file
             )
 
         else:
@@ -457,10 +429,7 @@ def main(
 
     finally:
         if report.any_criticals():
-            report.add_attachment(f'logs/{parent_config.get("log_file")}.log')
+            report.add_attachment(f'logs/{log_file}.log')
         report.send_email()
 
-if __name__ == "__main__":
-    app()
-
-all = ["last_date_of_cds_data", "check_cds_credentials", "retrieve_data_from_cds", "fetch_and_upload_cds_data", "main", "app"]
+all = ["last_date_of_cds_data", "check_cds_credentials", "retrieve_data_from_cds", "fetch_and_upload_cds_data", "main"]
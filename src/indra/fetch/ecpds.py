@@ -1,16 +1,23 @@
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, time, timedelta, timezone
 from typing import Optional, Union
 
-import requests
-from bs4 import BeautifulSoup
 from requests.exceptions import HTTPError
 
-from indra.io import download_from_url
+from indra.io import POOL_MAXSIZE, download_from_url, download_from_url_parallel, get_session
 
 logger = logging.getLogger("indrafetch")
 logging.captureWarnings(True)
 
+# The ECPDS index is a plain directory listing, so links are pulled out with a regex rather than an HTML parser
+HREF_RE = re.compile(r'<a\s[^>]*?href=["\']([^"\']*)["\']', re.IGNORECASE)
+# Date directories in the ECPDS listing look like ``/forecasts/20250101/``
+DATE_DIR_RE = re.compile(r'(?:^|/)(\d{8})/$')
+# Concurrent range requests per GRIB file
+GRIB_DOWNLOAD_PARTS = 4
+
 
 def last_date_of_ecpds_data(*,
                           ecpds_url: str = "https://data.ecmwf.int/forecasts/"
@@ -39,28 +46,24 @@ def last_date_of_ecpds_data(*,
     """
 
     logger.debug(f"Request URL: {ecpds_url}")
-    response = requests.get(url=ecpds_url, timeout=10)
+    response = get_session().get(url=ecpds_url, timeout=10)
     if response.status_code != 200:
         logger.error(f"Failed to retrieve the directory: {response.status_code}")
         return None
 
-    # Parse the HTML content
-    soup = BeautifulSoup(response.text, 'html.parser')
-
     # Find all links in the directory listing
-    links = soup.find_all('a')
+    hrefs = HREF_RE.findall(response.text)
 
     # Extract dates from the folder names
     dates = []
-    for link in links:
-        href = link.get('href')
-        if href and href.endswith('/'):  # Only consider directories
+    for href in hrefs:
+        match = DATE_DIR_RE.search(href)
+        if match:  # Only consider date directories
+            date_str = match.group(1)
             try:
-                # Convert the folder name to a date
-                date = datetime.strptime(href.split('/')[2], '%Y%m%d')
-                dates.append(date)
+                dates.append(datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8])))
             except ValueError:
-                continue  # Skip if the format is incorrect
+                continue  # Skip if the digits are not a valid date
 
     # Find the latest date
     if dates:
@@ -93,6 +96,34 @@ def last_date_of_ecpds_data(*,
         return None
 
 
+def _fetch_grib_and_index(url: str, filename: str, *, output_dir: str, chunk: bool, chunk_size: int) -> tuple[bool, bool]:
+    """Download a forecast GRIB file and, if that succeeds, its index file.
+
+    :returns:
+        A ``(grib_success, index_success)`` tuple.
+    """
+    logger.debug(f"Attempting to retrieve data from URL: {url}")
+    # GRIB files run to hundreds of MB, so they are fetched with parallel range requests; index files are small
+    grib_success = download_from_url_parallel(url=url,
+                                              output_dir=output_dir,
+                                              filename=filename,
+                                              parts=GRIB_DOWNLOAD_PARTS,
+                                              raise_error=False,
+                                              chunk=chunk,
+                                              chunk_size=chunk_size)
+    if not grib_success:
+        return False, False
+
+    index_url = url.replace(".grib2", ".index")
+    index_filename = filename.replace(".grib2", ".index")
+    index_success = download_from_url(url=index_url,
+                                      output_dir=output_dir,
+                                      filename=index_filename,
+                                      raise_error=False,
+                                      chunk=False)
+    return grib_success, index_success
+
+
 def retrieve_data_from_ecpds(*,
                              get_latest_date: bool = True,
                              custom_date: Optional[datetime] = None,
@@ -220,35 +251,26 @@ def retrieve_data_from_ecpds(*,
 
     forecast_times = forecast_times if isinstance(forecast_times, list) else [forecast_times]
 
-    grib_successes = [None] * len(forecast_times)
-    index_successes = [None] * len(forecast_times)
-    for i, forecast_time in enumerate(forecast_times):
+    urls_and_filenames = []
+    for forecast_time in forecast_times:
         url = (
             f"{ecpds_base_url}/{formatted_date}/{zulu_utc_timestamp}/{model}/"
             f"{resolution}/{forecast_type}/{formatted_date_with_time}-{forecast_time}-{forecast_type}-fc.grib2"
         )
-        logger.debug(f"Attempting to retrieve data from URL: {url}")
         filename = f"{formatted_date_with_time}-{forecast_time}-{forecast_type}-fc.grib2"
-        grib_success = download_from_url(url=url,
-                                         output_dir=output_dir,
-                                         filename=filename,
-                                         raise_error=False,
-                                         chunk=chunk,
-                                         chunk_size=chunk_size)
-        if grib_success:
-            index_url = url.replace(".grib2", ".index")
-            index_filename = filename.replace(".grib2", ".index")
-            index_success = download_from_url(url=index_url,
-                                              output_dir=output_dir,
-                                              filename=index_filename,
-                                              raise_error=False,
-                                              chunk=False)
-        if not grib_success:
-            index_success = False
-        grib_successes[i] = grib_success
-        index_successes[i] = index_success
-
-    if all(grib_successes) and all(index_successes):
+        urls_and_filenames.append((url, filename))
+
+    # The downloads are network-bound and independent, so forecast times are fetched concurrently. Each GRIB download
+    # opens GRIB_DOWNLOAD_PARTS connections, so the workers are capped to keep the total within the shared session's pool.
+    max_workers = max(1, min(len(forecast_times), POOL_MAXSIZE // GRIB_DOWNLOAD_PARTS))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_fetch_grib_and_index, url, filename, output_dir=output_dir, chunk=chunk, chunk_size=chunk_size)
+            for url, filename in urls_and_filenames
+        ]
+        results = [future.result() for future in futures]
+
+    if all(grib_success and index_success for grib_success, index_success in results):
         logger.info(f"Successfully retrieved data and index files from ECPDS for date {date}")
         return True
     elif raise_error:
@@ -1,19 +1,47 @@
-import io
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Optional
 
+import numpy as np
 import pandas as pd
-import typer
 from requests.exceptions import HTTPError
 
-from indra.io import get_params, retry_session, upload_data_to_s3
+from indra.io import get_params, get_session, upload_data_to_s3
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional extra, fall back to the stdlib parser
+    from json import loads as json_loads
+
+# Presentation-only fields in the IMD payloads, never written out
+DROPPED_COLUMNS = ["WEATHER_ICON", "WEATHER_MESSAGE", "BACKGROUND", "BACKGROUND_URL"]
 
 logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
 
-app = typer.Typer()
+def infer_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the object columns whose values are all numeric strings (or null) to numbers.
+
+    ``pd.DataFrame.from_records`` keeps JSON strings as ``str``, whereas ``pd.read_json`` coerced numeric columns
+    (e.g. station IDs, wind direction, weather code) to ``int64``/``float64``. This only approximates that inference:
+    columns with empty strings are left as they are, as ``pd.read_json`` did, but so are columns holding ``'nan'``
+    strings, which ``pd.read_json`` read as ``float64``.
+
+    :param pd.DataFrame df:
+        The raw IMD data.
+
+    :return:
+        The same DataFrame with its fully numeric columns converted.
+    """
+    for col in df.select_dtypes(include="object").columns:
+        if df[col].eq('').any():
+            continue
+        try:
+            df[col] = pd.to_numeric(df[col])
+        except (ValueError, TypeError):
+            continue
+    return df
 
 def clean_imd_data(df: pd.DataFrame, datacode: str, live=False) -> pd.DataFrame:
     """Clean the IMD data.
@@ -33,16 +61,17 @@ def clean_imd_data(df: pd.DataFrame, datacode: str, live=False) -> pd.DataFrame:
         The cleaned IMD data as a pandas DataFrame.
     """
 
-    # Drop the WEATHER_ICON, WEATHER_MESSAGE, BACKGROUND, and BACKGROUND_URL columns
-    df = df.drop(columns=["WEATHER_ICON", "WEATHER_MESSAGE", "BACKGROUND", "BACKGROUND_URL"])
+    # Drop the WEATHER_ICON, WEATHER_MESSAGE, BACKGROUND, and BACKGROUND_URL columns, if they were loaded at all
+    df = df.drop(columns=DROPPED_COLUMNS, errors='ignore')
     if datacode == "imd_Station_API":
         # Validate and fix the date and time columns, and use them to create a new timestamp column
         df["Date"] = pd.to_datetime(df["Date of Observation"], errors='coerce')
         df.drop(columns=["Date of Observation"], inplace=True)
         df['Time'] = df['Time'].astype(str).str.zfill(2)
-        df.insert(0, 'timestamp', df.apply(
-            lambda row: f"{row['Date'].strftime('%Y-%m-%d')}T{row['Time']}:00:00.00+05:30", axis=1
-        ))
+        date_str = np.datetime_as_string(df['Date'].to_numpy(dtype='datetime64[D]'))
+        time_str = df['Time'].to_numpy(dtype=str)
+        timestamp = np.char.add(np.char.add(date_str, 'T'), np.char.add(time_str, ':00:00.00+05:30'))
+        df.insert(0, 'timestamp', pd.Series(timestamp, index=df.index, dtype=object).mask(df['Date'].isna()))
         # Clean the Station and Sunset columns to remove all trailing and leading \r, \n, \t, and spaces
         df["Station"] = df["Station"].str.strip("\r\n\t ")
         df["Sunset"] = df["Sunset"].str.strip("\r\n\t ")
@@ -83,10 +112,7 @@ def clean_imd_data(df: pd.DataFrame, datacode: str, live=False) -> pd.DataFrame:
         df.rename(columns=mapper_dict, inplace=True)
 
         # Convert the numeric columns to float
-        for col in numeric_cols:
-            df[col] = df[col].replace('NA', None)
-            df[col] = df[col].replace('', None)
-            df[col] = df[col].astype(float)
+        df[numeric_cols] = df[numeric_cols].replace({'NA': np.nan, '': np.nan}).astype(float)
 
         # Convert Station Name to All Caps
         df["stationName"] = df["stationName"].str.upper()
@@ -99,9 +125,10 @@ def clean_imd_data(df: pd.DataFrame, datacode: str, live=False) -> pd.DataFrame:
         df['TIME'] = pd.to_datetime(df['TIME'], errors='coerce', format='%H:%M:%S')
         df.rename(columns= {"ID": "stationID"}, inplace=True)
 
-        df.insert(0, 'timestamp', df.apply(
-            lambda row: f"{row['DATE'].strftime('%Y-%m-%d')}T{row['TIME'].strftime('%H:%M:%S.00+05:30')}", axis=1
-        ))
+        # Combine the date with the time of day and stringify both in one numpy call
+        observed_at = df['DATE'].dt.normalize() + (df['TIME'] - df['TIME'].dt.normalize())
+        timestamp = np.char.add(np.datetime_as_string(observed_at.to_numpy(dtype='datetime64[s]')), '.00+05:30')
+        df.insert(0, 'timestamp', pd.Series(timestamp, index=df.index, dtype=object).mask(observed_at.isna()))
 
         # Drop the Date and Time columns
         df = df.drop(columns=["DATE", "TIME"])
@@ -113,6 +140,7 @@ def retrieve_live_data_from_imd(datacode: str, timecode: str, params: dict):
     """Retrieve live data from the Indian Meteorological Department (IMD).
 
     This function fetches live data from the IMD using the specified URL and data code.
+    The data is saved as snappy-compressed Parquet when the dataset's ``extension`` is ``parquet``, and as CSV otherwise.
 
     :param str url:
         The URL to download the data from.
@@ -151,7 +179,7 @@ def retrieve_live_data_from_imd(datacode: str, timecode: str, params: dict):
     logger.debug(f"Request timecode: {timecode}")
     logger.debug(f"Current Date and Time: {datetime.now()}")
     logger.info(f"Initating Download of {datacode} Data")
-    session = retry_session(retries=3)
+    session = get_session(retries=3)
     response = session.get(url, timeout=10)  # Timeout after 10 seconds
     logger.debug(f"Response status code: {response.status_code}")
 
@@ -161,10 +189,15 @@ def retrieve_live_data_from_imd(datacode: str, timecode: str, params: dict):
     # Check if the response status code is 200 (OK)
     if response.status_code == 200:
         logger.info(f"Data downloaded successfully from {url}")
-        df = clean_imd_data(pd.read_json(io.StringIO(response.text)), live=True, datacode=datacode)
+        records = json_loads(response.content)
+        # from_records raises on excluded fields that are absent, so only skip the ones this payload carries
+        present = records[0].keys() if records else ()
+        exclude = [col for col in DROPPED_COLUMNS if col in present]
+        df = infer_numeric_columns(pd.DataFrame.from_records(records, exclude=exclude))
+        df = clean_imd_data(df, live=True, datacode=datacode)
         logger.info("Data cleaned successfully")
 
-        # Save the data to a CSV file
+        # Save the data in the format named by the configured extension (parquet or csv)
         timecode = datetime.strptime(timecode, "%Y-%m-%dT%H:%M:%S")
         date = timecode.strftime("%Y_%m_%d")
         time = timecode.strftime("%H_%M_%S")
@@ -173,8 +206,13 @@ def retrieve_live_data_from_imd(datacode: str, timecode: str, params: dict):
         s3_prefix = f"{imd_params['ds_id']}-{imd_params['ds_name']}/{imd_params['folder_name']}/{date}"
         output_dir = Path(shared_params['local_data_dir']).expanduser() / Path(shared_params['s3_bucket']) / Path(s3_prefix)
         output_dir.mkdir(parents=True, exist_ok=True)
-        df.to_csv(output_dir / f"{time}.csv", index=False)
-        logger.debug(f"Data saved to {output_dir / f'{time}.csv'}")
+        extension = imd_params['extension'].lstrip('.')
+        output_path = output_dir / f"{time}.{extension}"
+        if extension == "parquet":
+            df.to_parquet(output_path, engine='pyarrow', compression='snappy', index=False)
+        else:
+            df.to_csv(output_path, index=False)
+        logger.debug(f"Data saved to {output_path}")
 
         # Upload the data to S3
         success = upload_data_to_s3(upload_dir=output_dir, Bucket=shared_params['s3_bucket'],
@@ -187,35 +225,8 @@ def retrieve_live_data_from_imd(datacode: str, timecode: str, params: dict):
         logger.error(f"Failed to download data from {url}. HTTP Status code: {response.status_code}")
         raise HTTPError(f"Failed to download data from {url}. HTTP Status code: {response.status_code}")
 
-@app.callback(invoke_without_command=True)
-def main(
-    ctx: typer.Context,
-    yaml_path: Annotated[
-        Path,
-        typer.Argument(
-            exists=True,
-            dir_okay=False,
-            resolve_path=True,
-            help="Path to YAML configuration file containing IMD parameters"
-        )
-    ],
-    debug: Annotated[
-        bool,
-        typer.Option(
-            "--debug/--no-debug",
-            "-d/-D",
-            help="Enable debug mode, send email without actually downloading data"
-        )
-    ] = False,
-    timecode: Annotated[
-        Optional[str],
-        typer.Option(
-            "--timecode",
-            "-t",
-            help="Timecode to retrieve data for"
-        )
-    ] = None
-) -> None:
+def main(yaml_path: Path, debug: bool = False, timecode: Optional[str] = None) -> None:
+    """Fetch every ``imd_*`` dataset configured in the YAML file and upload it to S3."""
     params = get_params(yaml_path)
     if timecode is None:
         timecode = datetime.now().strftime("%Y-%m-%dT%H:00:00")
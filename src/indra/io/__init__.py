@@ -1,12 +1,34 @@
+import copy
+import functools
+import os
+
 import yaml
 
-from indra.io.download import download_from_url, retry_session
+from indra.io._session import POOL_MAXSIZE, get_session, retry_session
+from indra.io.download import download_from_url, download_from_url_parallel
 from indra.io.upload import upload_data_to_s3
 
+# libyaml's C loader when PyYAML was built with it, otherwise the pure-Python one
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(yaml_path, mtime_ns):
+    with open(yaml_path, 'rb') as file:
+        return yaml.load(file, Loader=_SafeLoader)
+
 
 def get_params(yaml_path):
-    with open(yaml_path, 'r') as file:
-        params = yaml.safe_load(file)
-    return params
+    # Parsed files are cached per path and modification time; callers get a copy they are free to mutate
+    params = _load_yaml(os.fspath(yaml_path), os.stat(yaml_path).st_mtime_ns)
+    return copy.deepcopy(params)
 
-__all__ = ["download_from_url", "get_params", "retry_session", "upload_data_to_s3"]
+__all__ = [
+    "POOL_MAXSIZE",
+    "download_from_url",
+    "download_from_url_parallel",
+    "get_params",
+    "get_session",
+    "retry_session",
+    "upload_data_to_s3",
+]
@@ -0,0 +1,85 @@
+import atexit
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connections kept open per host by the shared sessions; callers running concurrent requests size their workers by it
+POOL_MAXSIZE = 10
+
+
+def retry_session(retries, session=None, backoff_factor=1, pool_connections=10, pool_maxsize=POOL_MAXSIZE):
+    """
+    Returns a session with retries enabled for given HTTP codes.
+    backoff is calculated as backoff between attempts = (backoff_factor) * (2 ** (no of retries failed))
+
+    :param int retries:
+        The number of retries to attempt.
+
+    :param requests.Session session:
+        The session to use for the request.
+
+    :param int backoff_factor:
+        The backoff factor to use for the retries.
+
+    :param int pool_connections:
+        The number of host connection pools to cache.
+
+        **Default**: ``10``
+
+    :param int pool_maxsize:
+        The maximum number of connections kept open per host.
+
+        **Default**: ``10``
+
+    :returns:
+        A session with retries enabled.
+
+    :raises HTTPError:
+        If there is an issue with the HTTP request.
+    """
+    session = session or requests.Session()
+    retry = Retry(
+        total=retries,
+        read=retries,
+        connect=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=[404, 500, 502, 504, 429]
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# Shared sessions keyed by retry budget; the lock makes creation happen once even when worker threads race for it
+_SESSIONS: dict[int, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+def get_session(retries: int = 0) -> requests.Session:
+    """Return the shared, connection-pooling session for the given retry budget.
+
+    Sessions are created on first use and closed at interpreter exit, so repeated requests to the same host
+    (ECPDS listings and downloads, IMD pulls) reuse open TCP/TLS connections instead of reconnecting every time.
+
+    :param int retries:
+        The number of retries to attempt. ``0`` returns a session without retries.
+
+        **Default**: ``0``
+
+    :returns:
+        The shared session for ``retries``.
+    """
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(retries)
+        if session is None:
+            if retries:
+                session = retry_session(retries)
+            else:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=POOL_MAXSIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+            atexit.register(session.close)
+            _SESSIONS[retries] = session
+        return session
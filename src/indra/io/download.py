@@ -1,57 +1,35 @@
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 import requests
-from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 from tqdm import tqdm
-from urllib3.util.retry import Retry
+
+# retry_session is re-exported for callers importing it from indra.io.download
+from indra.io._session import get_session, retry_session  # noqa: F401
 
 logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
 
+# e.g. "bytes 0-1048575/52428800"; the total may be "*" when unknown
+CONTENT_RANGE_RE = re.compile(r'bytes (\d+)-(\d+)/(\d+|\*)')
 
-def retry_session(retries, session=None, backoff_factor=1):
-    """
-    Returns a session with retries enabled for given HTTP codes.
-    backoff is calculated as backoff between attempts = (backoff_factor) * (2 ** (no of retries failed))
-
-    :param int retries:
-        The number of retries to attempt.
+# Ranges and sizes must count the bytes on disk, so ask for the body uncompressed (requests sends gzip by default)
+IDENTITY_ENCODING = {'Accept-Encoding': 'identity'}
 
-    :param requests.Session session:
-        The session to use for the request.
-
-    :param int backoff_factor:
-        The backoff factor to use for the retries.
-
-    :returns:
-        A session with retries enabled.
-
-    :raises HTTPError:
-        If there is an issue with the HTTP request.
-    """
-    session = session or requests.Session()
-    retry = Retry(
-        total=retries,
-        read=retries,
-        connect=retries,
-        backoff_factor=backoff_factor,
-        status_forcelist=[404, 500, 502, 504, 429]
-    )
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount('http://', adapter)
-    session.mount('https://', adapter)
-    return session
 
 def download_from_url(url: str, output_dir: str, filename: str,
                       timeout_seconds: int = 10, raise_error: bool = True,
-                      chunk: bool = True, chunk_size: int = 1048576):
+                      chunk: bool = True, chunk_size: int = 1048576,
+                      session: Optional[requests.Session] = None):
     """Download data from a URL and save it to a file.
 
     This function downloads data from a specified URL and saves it to a file in the specified directory.
-    This is meant for open access data with no authentication required. It is recommended to use it with the retry_session function to
-    ensure that the data is downloaded successfully.
+    This is meant for open access data with no authentication required. Unless a session is passed, the shared
+    pooled session with 10 retries is used, so consecutive downloads from the same host reuse their connection.
 
     :param str url:
         The URL to download the data from.
@@ -82,6 +60,11 @@ def download_from_url(url: str, output_dir: str, filename: str,
 
         **Default**: ``1048576``
 
+    :param Optional[requests.Session] session:
+        The session to make the request with.
+
+        **Default**: ``get_session(retries=10)``
+
     :returns:
         True if the data was downloaded successfully, False otherwise.
 
@@ -99,7 +82,7 @@ def download_from_url(url: str, output_dir: str, filename: str,
     ```
     """
     logger.debug(f"Logging Get Request at url: {url}")
-    session = retry_session(retries = 10)
+    session = session or get_session(retries=10)
     response = session.get(url, timeout=timeout_seconds, stream=chunk)  # Enable streaming if chunk is True
 
     # Check if the response status code is 200 (OK)
@@ -145,3 +128,169 @@ def download_from_url(url: str, output_dir: str, filename: str,
         else:
             logger.warning(f"Failed to download data from {url}. HTTP Status code: {response.status_code}")
             return False
+
+def _download_range(session: requests.Session, url: str, path: Path, start: int, end: int,
+                    timeout_seconds: int, chunk_size: int, bar: tqdm) -> bool:
+    """Download bytes ``start``-``end`` (inclusive) of ``url`` into the same offset of the file at ``path``.
+
+    :returns:
+        True only if the server answered with exactly the requested range and all of its bytes were written.
+    """
+    expected_size = end - start + 1
+    try:
+        with session.get(url, headers={'Range': f'bytes={start}-{end}', **IDENTITY_ENCODING},
+                         timeout=timeout_seconds, stream=True) as response:
+            if response.status_code != 206:
+                logger.warning(f"Range request bytes={start}-{end} for {url} returned HTTP Status code: {response.status_code}")
+                return False
+
+            content_range = response.headers.get('content-range', '')
+            match = CONTENT_RANGE_RE.fullmatch(content_range.strip())
+            if match is None or (int(match.group(1)), int(match.group(2))) != (start, end):
+                logger.warning(f"Range request bytes={start}-{end} for {url} returned Content-Range: {content_range!r}")
+                return False
+
+            # Each part gets its own handle so the writes do not share a file position
+            written = 0
+            with open(path, "r+b") as f:
+                f.seek(start)
+                for data in response.iter_content(chunk_size=chunk_size):
+                    if written + len(data) > expected_size:
+                        logger.warning(f"Range request bytes={start}-{end} for {url} returned more than {expected_size} bytes")
+                        return False
+                    f.write(data)
+                    written += len(data)
+                    bar.update(len(data))
+    except requests.RequestException as e:
+        logger.warning(f"Range request bytes={start}-{end} for {url} failed: {e}")
+        return False
+
+    if written != expected_size:
+        logger.warning(f"Range request bytes={start}-{end} for {url} returned {written} of {expected_size} bytes")
+        return False
+    return True
+
+def download_from_url_parallel(url: str, output_dir: str, filename: str,
+                               parts: int = 4, timeout_seconds: int = 10, raise_error: bool = True,
+                               chunk: bool = True, chunk_size: int = 1048576,
+                               session: Optional[requests.Session] = None):
+    """Download a large file using several concurrent HTTP Range requests.
+
+    The file size is read from a HEAD request and split into ``parts`` byte ranges, which are downloaded in parallel
+    and written at their offsets in a preallocated file. Several connections fill high-latency links that a single
+    stream cannot. If the server does not advertise range support, or the file is smaller than two chunks per part,
+    this falls back to :func:`download_from_url`. It also retries the whole file once with :func:`download_from_url`
+    if any range fails, e.g. when a server or proxy advertises ranges but answers them with the full body.
+
+    :param str url:
+        The URL to download the data from.
+
+    :param str output_dir:
+        The directory to save the downloaded data.
+
+    :param str filename:
+        The name of the file to save the data to.
+
+    :param int parts:
+        The number of ranges to download concurrently.
+
+        **Default**: ``4``
+
+    :param int timeout_seconds:
+        The number of seconds to wait before timing out each request.
+
+        **Default**: ``10``
+
+    :param bool raise_error:
+        Whether to raise an error if the download fails.
+
+        **Default**: ``True``
+
+    :param bool chunk:
+        Whether to show download progress.
+
+        **Default**: ``True``
+
+    :param int chunk_size:
+        The size of each streamed chunk in bytes.
+
+        **Default**: ``1048576``
+
+    :param Optional[requests.Session] session:
+        The session to make the requests with.
+
+        **Default**: ``get_session(retries=10)``
+
+    :returns:
+        True if the data was downloaded successfully, False otherwise.
+
+    :raises HTTPError:
+        If there is an issue with the HTTP request.
+
+    **Example:**
+
+    ```python
+    download_from_url_parallel(
+        url="https://data.ecmwf.int/forecasts/20250101/00z/ifs/0p25/oper/20250101000000-0h-oper-fc.grib2",
+        output_dir="./downloads",
+        filename="20250101000000-0h-oper-fc.grib2"
+    )
+    ```
+    """
+    logger.debug(f"Logging Head Request at url: {url}")
+    session = session or get_session(retries=10)
+    try:
+        head = session.head(url, headers=IDENTITY_ENCODING, timeout=timeout_seconds, allow_redirects=True)
+    except requests.RequestException as e:
+        if raise_error:
+            logger.error(f"Failed to request {url}: {e}")
+            raise
+        logger.warning(f"Failed to request {url}: {e}")
+        return False
+
+    total_size = int(head.headers.get('content-length', 0))
+    accepts_ranges = head.headers.get('accept-ranges', '').lower() == 'bytes'
+    if head.status_code != 200 or not accepts_ranges or total_size <= 2 * chunk_size * parts:
+        logger.debug(f"Range download not applicable for {url} (status {head.status_code}, size {total_size} bytes, "
+                     f"ranges {'supported' if accepts_ranges else 'unsupported'}). Using a single request.")
+        return download_from_url(url=url, output_dir=output_dir, filename=filename,
+                                 timeout_seconds=timeout_seconds, raise_error=raise_error,
+                                 chunk=chunk, chunk_size=chunk_size, session=session)
+
+    path = Path(output_dir) / filename
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.truncate(total_size)
+
+    part_size = -(-total_size // parts)  # Ceiling division so the last range ends at the last byte
+    ranges = [(start, min(start + part_size, total_size) - 1) for start in range(0, total_size, part_size)]
+    logger.info(f"Writing {total_size} bytes to file at path: {path} using {len(ranges)} parallel range requests.")
+
+    success = False
+    try:
+        with tqdm(
+            desc=filename,
+            total=total_size,
+            unit='B',
+            unit_scale=True,
+            unit_divisor=1024,  # Keep this as 1024 for proper scaling in MB
+            disable=not chunk,
+        ) as bar, ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(_download_range, session, url, path, start, end, timeout_seconds, chunk_size, bar)
+                for start, end in ranges
+            ]
+            success = all([future.result() for future in futures])
+    finally:
+        # Never leave the preallocated, partly zero-filled file behind
+        if not success:
+            path.unlink(missing_ok=True)
+
+    if success:
+        logger.info(f"Data written to file at path: {path}")
+        return True
+
+    logger.warning(f"Failed to download data from {url} using range requests. Retrying with a single request.")
+    return download_from_url(url=url, output_dir=output_dir, filename=filename,
+                             timeout_seconds=timeout_seconds, raise_error=raise_error,
+                             chunk=chunk, chunk_size=chunk_size, session=session)